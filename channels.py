@@ -11,10 +11,216 @@
 ##  Author: Eduardo Pinto (epmcj@dcc.ufmg.br)                                ##
 ###############################################################################
 
-from random import random
-from math   import log10, sqrt, erfc, cos, pi, e
+from math      import log10, sqrt, cos, pi, exp, expm1, log1p
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit   = None
+    prange = range
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    # Optional compiled scalar kernels (see channels_kernel.pyx); used
+    # when numba is not available. Build with:
+    #     python setup.py build_ext --inplace
+    import channels_kernel as _ckernel
+except ImportError:
+    _ckernel = None
+
+def _jit(**options):
+    # Applies numba.njit when available; otherwise leaves the function as
+    # pure Python so the module works without numba installed.
+    if njit is None:
+        return lambda func: func
+    return njit(**options)
+
+_LN10_10 = 0.23025850929940458 # ln(10)/10, for 10**(x/10) as exp
+
+_rng = np.random.default_rng() # shared PCG64 generator for batched draws
+
+_RNG_BUF_SIZE = 4096
+_rng_buf = _rng.random(_RNG_BUF_SIZE)
+_rng_pos = 0
+
+def _rand():
+    # Next uniform from a pre-drawn block of the shared generator: one
+    # vectorized PCG64 draw per 4096 calls instead of a Python-level
+    # Mersenne-Twister call (and its module-global state) per packet.
+    #
+    global _rng_buf, _rng_pos
+    pos = _rng_pos
+    if pos == _RNG_BUF_SIZE:
+        _rng_buf = _rng.random(_RNG_BUF_SIZE)
+        pos = 0
+    _rng_pos = pos + 1
+    return _rng_buf[pos]
+
+@_jit(cache = True, fastmath = True)
+def _erfc_fast(x):
+    # Rational approximation of erfc for x >= 0, Abramowitz & Stegun
+    # eq. 7.1.26. Absolute error < 1.5e-7, far below what the PER model
+    # resolves, and roughly a handful of multiply-adds instead of the
+    # full libm erfc. The sqrt(snr) argument here is always nonnegative.
+    #
+    # Estrin evaluation of the degree-5 polynomial: the sub-expressions
+    # are independent, so the compiled (njit) path can issue their
+    # multiplies in parallel instead of Horner's serial dependency chain.
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    t2 = t * t
+    t4 = t2 * t2
+    poly = (0.254829592 * t - 0.284496736 * t2) \
+           + (1.421413741 * t - 1.453152027 * t2) * t2 \
+           + 1.061405429 * t4 * t
+    return poly * exp(-x * x)
+
+@_jit(cache = True, fastmath = True)
+def _acoustic_perRF_kernel(k, s, w, distance, frequency, Pt, psize, noise_bw):
+    # Scalar acoustic PER with Thorp attenuation and Urick noise inlined,
+    # compilable by numba as one straight-line float kernel.
+    #
+    f2 = frequency * frequency
+    # branchless blend of the two Thorp formulas: both are computed and
+    # selected arithmetically so the batch loop stays vectorizable
+    hi = 0.11 * f2 / (1 + f2) + (
+         44 * (f2 / (4100 + frequency))) + (
+         2.75e-4 * f2 + 0.003)
+    lo = 0.002 + 0.11 * (f2 / (1 + f2)) + 0.011 * f2
+    m = (f2 > 0.4) * 1.0
+    atten = m * hi + (1.0 - m) * lo
+    pl = 10.0 * k * log10(distance) + distance * atten / 1000
+    lf = log10(frequency)
+    nTurbulence = 10 ** ((17 - 30 * lf) * 0.1)
+    nShipping = 10 ** ((40 + 20 * (s - 0.5) + 26 * lf
+                        - 60 * log10(frequency + 0.03)) * 0.1)
+    nWind = 10 ** ((50 + 7.5 * sqrt(w) + 20 * lf
+                    - 40 * log10(frequency + 0.4)) * 0.1)
+    nThermal = 10 ** ((20 * lf - 15) * 0.1)
+    nf = noise_bw * 10 * log10(nTurbulence + nShipping + nWind + nThermal)
+    snrdB = Pt - pl - nf
+    snr = exp(snrdB * _LN10_10)
+    # using BPSK bit error rate w/ Rayleigh fading
+    ber = 0.5 * (1 - sqrt(snr / (1 + snr)))
+    return -expm1(8 * psize * log1p(-ber))
+
+@_jit(cache = True, fastmath = True, parallel = True)
+def _acoustic_perRF_batch_kernel(k, s, w, distance, frequency, Pt, psize,
+                                 noise_bw):
+    # Parallel batch variant for Monte-Carlo sweeps; distance and
+    # frequency are same-length 1-d arrays.
+    #
+    n = distance.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = _acoustic_perRF_kernel(k, s, w, distance[i], frequency[i],
+                                        Pt, psize, noise_bw)
+    return out
+
+@_jit(cache = True, fastmath = True)
+def _optical_perRF_kernel(c, two_Ar, two_At, one_minus_cos_theta, S2,
+                          denom_noise, P, distance, d, beta, psize):
+    # Scalar optical PER kernel over the precomputed instance constants.
+    #
+    p = P * two_Ar * cos(beta)
+    p = p / (pi * distance * distance * one_minus_cos_theta + two_At)
+    p = p * exp(-c * d)
+    snr = S2 * p * p / denom_noise
+    # using BPSK bit error rate w/ Rayleigh fading
+    ber = 0.5 * (1 - sqrt(snr / (1 + snr)))
+    return -expm1(8 * psize * log1p(-ber))
+
+def acoustic_perRF_soa(k, s, w, distance, frequency, Pt, psize,
+                       noise_bw = 2.35):
+    # Structure-of-arrays acoustic PER: every parameter may be an
+    # N-vector (or a scalar, broadcast), so all links of a network time
+    # step are evaluated in one pass of numpy ufuncs instead of one
+    # attribute-heavy Python call per link. Channel instances then act
+    # as an index into the shared parameter arrays.
+    #
+    k = np.asarray(k, dtype = float)
+    s = np.asarray(s, dtype = float)
+    w = np.asarray(w, dtype = float)
+    d = np.asarray(distance, dtype = float)
+    f = np.asarray(frequency, dtype = float)
+    f2 = f * f
+    hi = 0.11 * f2 / (1 + f2) + (
+         44 * (f2 / (4100 + f))) + (
+         2.75e-4 * f2 + 0.003)
+    lo = 0.002 + 0.11 * (f2 / (1 + f2)) + 0.011 * f2
+    atten = np.where(f2 > 0.4, hi, lo) / 1000
+    pl = 10.0 * k * np.log10(d) + d * atten
+    lf = np.log10(f)
+    nTurbulence = 10 ** ((17 - 30 * lf) * 0.1)
+    nShipping = 10 ** ((40 + 20 * (s - 0.5) + 26 * lf
+                        - 60 * np.log10(f + 0.03)) * 0.1)
+    nWind = 10 ** ((50 + 7.5 * np.sqrt(w) + 20 * lf
+                    - 40 * np.log10(f + 0.4)) * 0.1)
+    nThermal = 10 ** ((20 * lf - 15) * 0.1)
+    nf = noise_bw * 10 * np.log10(nTurbulence + nShipping + nWind + nThermal)
+    snrdB = Pt - pl - nf
+    snr = np.exp(snrdB * _LN10_10)
+    # using BPSK bit error rate w/ Rayleigh fading
+    ber = 0.5 * (1 - np.sqrt(snr / (1 + snr)))
+    # expm1/log1p form avoids the cancellation of (1 - ber) ** (8 * psize)
+    return -np.expm1(8 * psize * np.log1p(-ber))
+
+@lru_cache(maxsize = 128)
+def _thorp(frequency):
+    # Thorp's attenuation in dB/m (dB re uPa)
+    # frequency in kHz
+    # Cached on frequency: simulator runs use a handful of fixed carriers.
+    #
+    f = frequency ** 2
+    if f > 0.4:
+        atten = 0.11 * f / (1 + f) + (
+                44 * (f / (4100 + frequency))) + (
+                2.75 * pow(10,(-4)) * f + 0.003)
+    else:
+        atten = 0.002 + 0.11 * (f / (1 + f)) + 0.011 * f
+    return atten/1000
+
+@lru_cache(maxsize = 4096)
+def _pathloss(k, distance, frequency):
+    # Transmission loss that occurs in a underwater acoustic channel.
+    # distance in meters
+    # frequency in kHz
+    # k, the spreading factor
+    # Cached on the whole key: on a mobility-free link distance is fixed
+    # between topology updates while per/perRF run once per packet, so
+    # the log10 and Thorp lookups are paid once per (distance, carrier).
+    # Callers round distance/frequency to keep the key space bounded.
+    #
+    return 10.0 * k * log10(distance) + distance * _thorp(frequency)
+
+@lru_cache(maxsize = 128)
+def _noise(s, w, frequency):
+    # Noise in an underwater acoustic channel, in dB re uPa
+    # "Priniciples of Underwater Sound" by Robert J. Urick
+    # frequency in kHz
+    # Cached on (s, w, frequency): all three are fixed for a channel, so
+    # the transcendental calls are paid once per carrier.
+    #
+    # log10(frequency) appears in all four terms; compute each log once
+    lf  = log10(frequency)
+    lfs = log10(frequency + 0.03)
+    lfw = log10(frequency + 0.4)
+    nTurbulence = 10 ** ((17 - 30 * lf) * 0.1)
+    nShipping = 10 ** ((40 + 20 * (s - 0.5) + 26 * lf - 60 * lfs) * 0.1)
+    nWind = 10 ** ((50 + 7.5 * sqrt(w) + 20 * lf - 40 * lfw) * 0.1)
+    nThermal = 10 ** ((20 * lf - 15) * 0.1)
+    noise = 10 * log10(nTurbulence + nShipping + nWind + nThermal)
+    return noise
 
 class Channel:
+    __slots__ = ()
+
     def use(self):
         raise NotImplementedError
 
@@ -25,7 +231,8 @@ class AcousticChannel(Channel):
     # Computing and Communications Review 11.4 (2007): 34-43.
 
     # Code based on PER from ns2.
-    __kvalues = [1.0, 1.5, 2.0] 
+    __slots__ = ('k', 's', 'w')
+    __kvalues = frozenset((1.0, 1.5, 2.0))
     soundSpeed = 1500 # Sound speed in water, in m/s
     def __init__(self, k, s, w):
         assert (k in self.__kvalues), 'k = 1.0 or 1.5 or 2.0'
@@ -41,7 +248,20 @@ class AcousticChannel(Channel):
     def use(self, frequency, power, distance, packetSize):
         #
         per = self.perRF(distance, frequency, power, packetSize)
-        return not (random() < per)
+        return not (_rand() < per)
+
+    def use_batch(self, n, frequency, power, distance, packetSize):
+        # Outcomes of n independent uses of the channel, as a boolean
+        # array (True = packet delivered). The PER is computed once (or
+        # batched when distance/frequency are arrays, broadcasting
+        # against the n draws) and all uniforms come from one vectorized
+        # PCG64 call instead of n Mersenne-Twister calls.
+        #
+        if np.ndim(distance) or np.ndim(frequency):
+            per = self.perRF_batch(distance, frequency, power, packetSize)
+        else:
+            per = self.perRF(distance, frequency, power, packetSize)
+        return _rng.random(n) >= per
 
     def pathloss(self, distance, frequency):
         # Transmission loss that occurs in a underwater acoustic channel.
@@ -49,41 +269,74 @@ class AcousticChannel(Channel):
         # frequency in kHz
         # k, the spreading factor
         #
-        return 10.0 * self.k * log10(distance) \
-               + distance * self.thorp(frequency)
-        
+        return _pathloss(self.k, round(distance, 3), round(frequency, 6))
+
 
     def thorp(self, frequency):
-        # Thorp's attenuation in dB/m (dB re uPa) 
+        # Thorp's attenuation in dB/m (dB re uPa)
         # frequency in kHz
         #
-        f = frequency ** 2
-        if f > 0.4:
-            atten = 0.11 * f / (1 + f) + (
-                    44 * (f / (4100 + frequency))) + (
-                    2.75 * pow(10,(-4)) * f + 0.003)
-        else:
-            atten = 0.002 + 0.11 * (f / (1 + f)) + 0.011 * f
-        return atten/1000
+        return _thorp(frequency)
+
+    def thorp_np(self, frequency):
+        # Thorp's attenuation in dB/m (dB re uPa), batched.
+        # frequency, array of frequencies in kHz
+        #
+        f2 = frequency * frequency
+        hi = 0.11 * f2 / (1 + f2) + (
+             44 * (f2 / (4100 + frequency))) + (
+             2.75e-4 * f2 + 0.003)
+        lo = 0.002 + 0.11 * (f2 / (1 + f2)) + 0.011 * f2
+        return np.where(f2 > 0.4, hi, lo) / 1000
+
+    def noise_np(self, frequency):
+        # Noise in an underwater acoustic channel, in dB re uPa, batched.
+        # frequency, array of frequencies in kHz
+        #
+        lf = np.log10(frequency)
+        nTurbulence = 10 ** ((17 - 30 * lf) * 0.1)
+        nShipping = 10 ** ((40 + 20 * (self.s - 0.5) + (
+                    26 * lf) - (
+                    60 * np.log10(frequency + 0.03))) * 0.1)
+        nWind = 10 ** ((50 + 7.5 * np.sqrt(self.w) + 20 * lf - (
+                40 * np.log10(frequency + 0.4))) * 0.1)
+        nThermal = 10 ** ((20 * lf - 15) * 0.1)
+        return 10 * np.log10(nTurbulence + nShipping + nWind + nThermal)
+
+    def pathloss_np(self, distance, frequency):
+        # Transmission loss in a underwater acoustic channel, batched.
+        # distance, array of distances in meters
+        # frequency, array of frequencies in kHz
+        #
+        return 10.0 * self.k * np.log10(distance) \
+               + distance * self.thorp_np(frequency)
+
+    def perRF_batch(self, distance, frequency, Pt, psize, noise_bw = 2.35):
+        # Packet error rate for whole batches of links at once.
+        # distance, array of distances in meters
+        # frequency, array of frequencies in kHz
+        # Pt, the transmission power in dB re uPa
+        # psize, the packet size in bytes
+        # noise_bw, receiver bandwidth in dB re uPa
+        # Inputs broadcast against each other; returns an ndarray of PERs.
+        #
+        d = np.asarray(distance, dtype = float)
+        f = np.asarray(frequency, dtype = float)
+        if njit is not None and d.ndim <= 1 and f.ndim <= 1 \
+           and (d.ndim == 1 or f.ndim == 1):
+            d, f = np.broadcast_arrays(d, f)
+            return _acoustic_perRF_batch_kernel(self.k, self.s, self.w,
+                                                np.ascontiguousarray(d),
+                                                np.ascontiguousarray(f),
+                                                Pt, psize, noise_bw)
+        return acoustic_perRF_soa(self.k, self.s, self.w, d, f,
+                                  Pt, psize, noise_bw)
 
     def noise(self, frequency):
         # Noise in an underwater acoustic channel, in dB re uPa
-        # "Priniciples of Underwater Sound" by Robert J. Urick
         # frequency in kHz
         #
-        nTurbulence = 17 - 30 * log10(frequency)
-        nTurbulence = 10 ** (nTurbulence * 0.1)
-        nShipping = 40 + 20 * (self.s - 0.5) + (
-                    26 * log10(frequency)) - ( 
-                    60 * log10(frequency + 0.03))
-        nShipping = 10 ** (nShipping * 0.1)
-        nWind = 50 + 7.5 * sqrt(self.w) + 20 * log10(frequency) - ( 
-                40 * log10(frequency + 0.4))
-        nWind = 10 ** (nWind * 0.1)
-        nThermal = 20 * log10(frequency) - 15
-        nThermal = 10 ** (nThermal * 0.1)
-        noise = 10 * log10(nTurbulence + nShipping + nWind + nThermal)
-        return noise
+        return _noise(self.s, self.w, frequency)
 
     def snr_dB(self, distance, frequency, Pt, psize, noise_bw):
         # Packet error rate
@@ -94,7 +347,7 @@ class AcousticChannel(Channel):
         # noise_bw, receiver bandwidth in dB re uPa
         #
         pl = self.pathloss(distance, frequency)
-        nf = noise_bw * self.noise(frequency)
+        nf = noise_bw * _noise(self.s, self.w, frequency)
         snrdB = Pt - pl - nf
         return snrdB
 
@@ -118,12 +371,13 @@ class AcousticChannel(Channel):
         # (!) Does not use snr function for speed.
         #
         pl = self.pathloss(distance, frequency)
-        nf = noise_bw * self.noise(frequency)
+        nf = noise_bw * _noise(self.s, self.w, frequency)
         snrdB = Pt - pl - nf
-        snr = 10 ** (snrdB/10) 
+        snr = exp(snrdB * _LN10_10)
         # using BPSK bit error rate w/ AWGN
-        ber = 0.5 * erfc(sqrt(snr))
-        return 1.0 - (1.0 - ber) ** (8 * psize)
+        ber = 0.5 * _erfc_fast(sqrt(snr))
+        # expm1/log1p form avoids the cancellation of (1 - ber) ** (8 * psize)
+        return -expm1(8 * psize * log1p(-ber))
 
     def perRF(self, distance, frequency, Pt, psize, noise_bw = 2.35):
         # Packet error rate
@@ -136,15 +390,23 @@ class AcousticChannel(Channel):
         #
         f = float(frequency)
         d = float(distance)
+        if njit is not None:
+            return _acoustic_perRF_kernel(self.k, self.s, self.w, d, f,
+                                          Pt, psize, noise_bw)
+        if _ckernel is not None:
+            return _ckernel.acoustic_perRF(self.k, self.s, self.w, d, f,
+                                           Pt, psize, noise_bw)
+        # pure-Python fallback
         # pl = self.pathloss(distance, frequency)
         pl = self.pathloss(d, f)
         # nf = noise_bw * self.noise(frequency)
-        nf = noise_bw * self.noise(f)
+        nf = noise_bw * _noise(self.s, self.w, f)
         snrdB = Pt - pl - nf
-        snr = 10 ** (snrdB/10)
+        snr = exp(snrdB * _LN10_10)
         # using BPSK bit error rate w/ Rayleigh fading
         ber = 0.5 * (1 - sqrt(snr / (1 + snr)))
-        return 1.0 - (1.0 - ber) ** (8 * psize)
+        # expm1/log1p form avoids the cancellation of (1 - ber) ** (8 * psize)
+        return -expm1(8 * psize * log1p(-ber))
 
 
 class OpticalChannel(Channel):
@@ -155,17 +417,21 @@ class OpticalChannel(Channel):
 
     q     = 1.6e-19  # Electronic charge, in C
     K     = 1.38e-23 # Boltzmann constant, in J/K
-    c     = None     # Beam light attenuation coefficient, in 1/m
-    T     = None     # Temperature, in K
-    S     = None     # Receiver sensitivity, in A/W
-    R     = None     # Photodiode shunt resistance, in ohms
-    Id    = None     # Photodiode dark current, in A 
-    Il    = None     # Photodiode current generated by incident light, in A
-    Ar    = None     # Receiver area, in m**2
-    At    = None     # Transmitter size, in m**2
-    bw    = None     # System bandwidth, in Hz
-    theta = None     # Transmitter light beam diverge angle, in rad
-    lightSpeed = 2.25e8 # Light speed in the water, in m/s 
+    lightSpeed = 2.25e8 # Light speed in the water, in m/s
+    __slots__ = (
+        'c',     # Beam light attenuation coefficient, in 1/m
+        'T',     # Temperature, in K
+        'S',     # Receiver sensitivity, in A/W
+        'R',     # Photodiode shunt resistance, in ohms
+        'Id',    # Photodiode dark current, in A
+        'Il',    # Photodiode current generated by incident light, in A
+        'Ar',    # Receiver area, in m**2
+        'At',    # Transmitter size, in m**2
+        'bw',    # System bandwidth, in Hz
+        'theta', # Transmitter light beam diverge angle, in rad
+        # precomputed hot-path constants (see __init__)
+        '_denom_noise', '_two_Ar', '_two_At', '_one_minus_cos_theta', '_S2',
+    )
 
     def __init__(self, c, T, S, R, Id, Il, Ar, At, bw, theta):
         self.c = c
@@ -178,26 +444,41 @@ class OpticalChannel(Channel):
         self.At = At
         self.bw = bw
         self.theta = theta
+        # Constants of the per/snr hot path that depend only on immutable
+        # instance state, hoisted out of the per-call code.
+        self._denom_noise = 2 * self.q * (Id + Il) * bw \
+                            + (4 * self.K * T * bw) / R
+        self._two_Ar = 2 * Ar
+        self._two_At = 2 * At
+        self._one_minus_cos_theta = 1 - cos(theta)
+        self._S2 = S * S
 
     def get_propagation_time(self, distance):
         return distance / self.lightSpeed
     
     def use(self, power, distance, d, beta, psize):
         per = self.perRF(power, distance, d, beta, psize)
-        return not (random() < per)
+        return not (_rand() < per)
 
     def snr_dB(self, P, distance, d, beta):
         return 10 * log10(self.snr(P, distance, d, beta))
 
     def snr(self, P, distance, d, beta):
+        # single LOAD_ATTR per attribute up front; the math below then
+        # runs on fast locals only
+        two_Ar = self._two_Ar
+        two_At = self._two_At
+        omct   = self._one_minus_cos_theta
+        c      = self.c
+        S2     = self._S2
+        denom_noise = self._denom_noise
         # Calculating the light power received
-        p = 2 * P * self.Ar * cos(beta)
-        p = p / (pi * (distance ** 2) * (1 - cos(self.theta)) + 2 * self.At)
-        p = p * (e ** (-self.c * d)) 
-        # Calculating SNR
-        thermalNoise = (4 * self.K * self.T * self.bw) / self.R # squared
-        currentNoise = 2 * self.q * (self.Id + self.Il) * self.bw # squared
-        snr = ((self.S * p) ** 2) / (currentNoise + thermalNoise)
+        p = P * two_Ar * cos(beta)
+        p = p / (pi * (distance ** 2) * omct + two_At)
+        p = p * exp(-c * d)
+        # Calculating SNR (denominator is the precomputed squared thermal
+        # plus current noise)
+        snr = S2 * p * p / denom_noise
         return snr
 
     def per(self, P, distance, d, beta, psize):
@@ -209,19 +490,65 @@ class OpticalChannel(Channel):
         # psize, the packet size in bytes
         # (!) Does not use snr function for speed.
         #
+        # single LOAD_ATTR per attribute up front; the math below then
+        # runs on fast locals only
+        two_Ar = self._two_Ar
+        two_At = self._two_At
+        omct   = self._one_minus_cos_theta
+        c      = self.c
+        S2     = self._S2
+        denom_noise = self._denom_noise
         # Calculating the light power received
-        p = 2 * P * self.Ar * cos(beta)
-        p = p / (pi * (distance ** 2) * (1 - cos(self.theta)) + 2 * self.At)
-        p = p * (e ** (-self.c * d)) 
-        # Calculating SNR
-        thermalNoise = (4 * self.K * self.T * self.bw) / self.R # squared
-        currentNoise = 2 * self.q * (self.Id + self.Il) * self.bw # squared
-        snr = ((self.S * p) ** 2) / (currentNoise + thermalNoise)
+        p = P * two_Ar * cos(beta)
+        p = p / (pi * (distance ** 2) * omct + two_At)
+        p = p * exp(-c * d)
+        # Calculating SNR (denominator is the precomputed squared thermal
+        # plus current noise)
+        snr = S2 * p * p / denom_noise
         # using BPSK bit error rate w/ AWGN
-        ber = 0.5 * erfc(sqrt(snr))
-        per = 1.0 - (1.0 - ber) ** (8 * psize)
+        ber = 0.5 * _erfc_fast(sqrt(snr))
+        # expm1/log1p form avoids the cancellation of (1 - ber) ** (8 * psize)
+        per = -expm1(8 * psize * log1p(-ber))
         return per
 
+    def perRF_batch(self, P, distance, d, beta, psize):
+        # Packet error rate for whole batches of links at once.
+        # P, the transmission power in dBm
+        # distance, array of distances in meters
+        # d
+        # beta, array of inclination angles in rad
+        # psize, the packet size in bytes
+        # Inputs broadcast against each other; returns an ndarray of PERs.
+        # With numexpr available the whole expression is fused into two
+        # threaded passes with no intermediate arrays.
+        #
+        distance = np.asarray(distance, dtype = float)
+        d = np.asarray(d, dtype = float)
+        beta = np.asarray(beta, dtype = float)
+        if numexpr is not None:
+            snr = numexpr.evaluate(
+                "S2 * (P * two_Ar * cos(beta)"
+                " / (pi_ * distance * distance * omct + two_At)"
+                " * exp(-c * d)) ** 2 / denom_noise",
+                local_dict = {"P": P, "beta": beta, "d": d,
+                              "distance": distance,
+                              "two_Ar": self._two_Ar, "two_At": self._two_At,
+                              "omct": self._one_minus_cos_theta,
+                              "pi_": pi, "c": self.c, "S2": self._S2,
+                              "denom_noise": self._denom_noise})
+            return numexpr.evaluate(
+                "-expm1(8 * psize * log1p(-(0.5 * (1 - sqrt(snr / (1 + snr))))))",
+                local_dict = {"snr": snr, "psize": psize})
+        p = P * self._two_Ar * np.cos(beta)
+        p = p / (pi * distance * distance * self._one_minus_cos_theta
+                 + self._two_At)
+        p = p * np.exp(-self.c * d)
+        snr = self._S2 * p * p / self._denom_noise
+        # using BPSK bit error rate w/ Rayleigh fading
+        ber = 0.5 * (1 - np.sqrt(snr / (1 + snr)))
+        # expm1/log1p form avoids the cancellation of (1 - ber) ** (8 * psize)
+        return -np.expm1(8 * psize * np.log1p(-ber))
+
     def perRF(self, P, distance, d, beta, psize):
         # Packet error rate
         # Pt, the transmission power  in dBm
@@ -231,15 +558,34 @@ class OpticalChannel(Channel):
         # psize, the packet size in bytes
         # (!) Does not use snr function for speed.
         #
+        if njit is not None:
+            return _optical_perRF_kernel(self.c, self._two_Ar, self._two_At,
+                                         self._one_minus_cos_theta, self._S2,
+                                         self._denom_noise, P, distance, d,
+                                         beta, psize)
+        if _ckernel is not None:
+            return _ckernel.optical_perRF(self.c, self._two_Ar, self._two_At,
+                                          self._one_minus_cos_theta, self._S2,
+                                          self._denom_noise, P, distance, d,
+                                          beta, psize)
+        # pure-Python fallback
+        # single LOAD_ATTR per attribute up front; the math below then
+        # runs on fast locals only
+        two_Ar = self._two_Ar
+        two_At = self._two_At
+        omct   = self._one_minus_cos_theta
+        c      = self.c
+        S2     = self._S2
+        denom_noise = self._denom_noise
         # Calculating the light power received
-        p = 2 * P * self.Ar * cos(beta)
-        p = p / (pi * (distance ** 2) * (1 - cos(self.theta)) + 2 * self.At)
-        p = p * (e ** (-self.c * d)) 
-        # Calculating SNR
-        thermalNoise = (4 * self.K * self.T * self.bw) / self.R # squared
-        currentNoise = 2 * self.q * (self.Id + self.Il) * self.bw # squared
-        snr = ((self.S * p) ** 2) / (currentNoise + thermalNoise)
+        p = P * two_Ar * cos(beta)
+        p = p / (pi * (distance ** 2) * omct + two_At)
+        p = p * exp(-c * d)
+        # Calculating SNR (denominator is the precomputed squared thermal
+        # plus current noise)
+        snr = S2 * p * p / denom_noise
         # using BPSK bit error rate w/ Rayleigh fading
         ber = 0.5 * (1 - sqrt(snr / (1 + snr)))
-        per = 1.0 - (1.0 - ber) ** (8 * psize)
+        # expm1/log1p form avoids the cancellation of (1 - ber) ** (8 * psize)
+        per = -expm1(8 * psize * log1p(-ber))
         return per
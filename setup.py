@@ -0,0 +1,16 @@
+###############################################################################
+##  Laboratorio de Engenharia de Computadores (LECOM)                        ##
+##  Departamento de Ciencia da Computacao (DCC)                              ##
+##  Universidade Federal de Minas Gerais (UFMG)                              ##
+##                                                                           ##
+##  Builds the optional compiled PER kernels (channels_kernel.pyx):         ##
+##      python setup.py build_ext --inplace                                  ##
+###############################################################################
+
+from setuptools   import setup
+from Cython.Build import cythonize
+
+setup(
+    name        = "captain-sim-kernels",
+    ext_modules = cythonize("channels_kernel.pyx", language_level = 3),
+)